@@ -4,21 +4,53 @@ A multi-agent system using CrewAI to prepare comprehensive meeting briefs.
 """
 
 import streamlit as st
-from dataclasses import dataclass
-from typing import Optional
-import os
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from array import array
+from collections import deque
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Type
+import asyncio
+import contextvars
+import hashlib
+import json
+import queue
+import re
+import sqlite3
+from string import Template
+import threading
+import time
 
 from crewai import Agent, Task, Crew
 from crewai.process import Process
 from crewai_tools import SerperDevTool
+import anthropic
+import httpx
 from langchain_anthropic import ChatAnthropic
+from langchain_core.caches import BaseCache
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.load import dumps, loads
+from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional: BriefCache falls back to exact matching
+    SentenceTransformer = None
 
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class MeetingConfig:
     """Configuration for meeting preparation."""
     company_name: str
@@ -30,155 +62,835 @@ class MeetingConfig:
 
 @dataclass
 class LLMConfig:
-    """LLM configuration settings."""
-    model: str = "claude-3-haiku-20240307"
+    """
+    LLM configuration settings.
+    
+    Research and planning agents use the fast tier; only the final synthesis
+    step, which produces the brief the user reads, uses the stronger model.
+    """
+    model_fast: str = "claude-3-haiku-20240307"
+    model_synth: str = "claude-sonnet-4-5-20250929"
     temperature: float = 0.7
 
 
+@dataclass
+class CrewConfig:
+    """Crew execution settings."""
+    max_parallel_agents: int = 3
+    timeout_seconds: int = 180
+    context_max_chars: int = 6000
+    trace_size: int = 500
+
+    @property
+    def parallel_research(self) -> bool:
+        """Whether the independent research tasks may run concurrently."""
+        return self.max_parallel_agents > 1
+
+
+@dataclass
+class CacheConfig:
+    """On-disk response cache settings."""
+    enabled: bool = True
+    path: str = ".cache/meeting_prep.sqlite"
+    search_ttl_hours: float = 6
+    llm_ttl_hours: float = 24
+    brief_ttl_hours: float = 24
+    brief_similarity_threshold: float = 0.95
+
+
+# =============================================================================
+# Retries
+# =============================================================================
+
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Return True for rate limits, overloads, server errors and network timeouts."""
+    if isinstance(exc, (anthropic.APIConnectionError, httpx.TransportError)):
+        return True
+    if isinstance(exc, anthropic.APIStatusError):
+        return exc.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in TRANSIENT_STATUS_CODES
+    return False
+
+
+class RetryCounter:
+    """Thread-safe count of retries performed during a run."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+    
+    def increment(self, retry_state=None) -> None:
+        with self._lock:
+            self.count += 1
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+
+
+def transient_retry_policy(counter: Optional[RetryCounter] = None) -> dict:
+    """
+    Tenacity arguments for retrying transient API failures.
+    
+    Up to three attempts with exponential backoff between 2 and 20 seconds;
+    each retry is recorded on ``counter`` when given.
+    """
+    return dict(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=20),
+        retry=retry_if_exception(is_transient_error),
+        before_sleep=counter.increment if counter is not None else None,
+        reraise=True,
+    )
+
+
+# =============================================================================
+# Prompt Caching
+# =============================================================================
+
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+# CrewAI renders an agent's whole ReAct prompt (role, tools, task description
+# and upstream context) as one human message ending in the "Begin!" line and
+# "Thought:"; the scratchpad of earlier turns is appended after that.
+REACT_BEGIN_MARKER = "\n\nBegin!"
+REACT_SCRATCHPAD_MARKER = "\n\nThought:"
+
+
+class CachedChatAnthropic(ChatAnthropic):
+    """
+    ChatAnthropic with an Anthropic prompt-cache breakpoint on each task's fixed prompt.
+
+    CrewAI re-sends the same ReAct prompt on every turn of an agent's reasoning
+    loop and only the appended scratchpad grows. The fixed part is sent as its
+    own content block carrying the breakpoint, so later turns of a task read it
+    from cache. Prefixes below Anthropic's minimum cacheable length (1024 tokens
+    for Sonnet, 2048 for Haiku) are sent uncached.
+    """
+
+    http_client: Optional[Any] = Field(default=None, exclude=True)
+    retry_counter: Optional[Any] = Field(default=None, exclude=True)
+
+    @cached_property
+    def _client(self) -> anthropic.Client:
+        # Share one pooled HTTP client so calls reuse open TLS connections
+        if self.http_client is None:
+            return super()._client
+        return anthropic.Client(
+            api_key=self.anthropic_api_key.get_secret_value(),
+            base_url=self.anthropic_api_url,
+            max_retries=self.max_retries,
+            default_headers=self.default_headers or None,
+            http_client=self.http_client,
+        )
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        # Clients are created with streaming=True, so both invoke() and
+        # stream() reach the API through here. Transient failures are retried
+        # until the first chunk arrives; later failures are raised, since
+        # chunks already passed on cannot be taken back.
+        for attempt in Retrying(**transient_retry_policy(self.retry_counter)):
+            with attempt:
+                chunks = super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+                first = next(chunks, None)
+        if first is not None:
+            yield first
+            yield from chunks
+
+    def _get_request_payload(self, input_, *, stop=None, **kwargs) -> dict:
+        payload = super()._get_request_payload(input_, stop=stop, **kwargs)
+
+        messages = payload.get("messages") or []
+        for i, message in enumerate(messages):
+            cached = _with_stable_prefix_breakpoint(message)
+            if cached is not message:
+                messages[i] = cached
+                break
+        return payload
+
+
+def _stable_prefix_length(text: str) -> int:
+    """Return the length of a ReAct prompt's fixed part, or 0 if it has none."""
+    begin = text.find(REACT_BEGIN_MARKER)
+    if begin < 0:
+        return 0
+    end = text.find(REACT_SCRATCHPAD_MARKER, begin)
+    if end < 0:
+        return 0
+    return end + len(REACT_SCRATCHPAD_MARKER)
+
+
+def _with_stable_prefix_breakpoint(message: dict) -> dict:
+    """
+    Return a copy of a ReAct prompt message split into a cached fixed block and the scratchpad.
+    
+    Messages that are not a single-text ReAct prompt are returned unchanged.
+    """
+    content = message.get("content")
+    if isinstance(content, list) and len(content) == 1 and content[0].get("type") == "text":
+        content = content[0].get("text")
+    if not isinstance(content, str):
+        return message
+    
+    split = _stable_prefix_length(content)
+    if not split:
+        return message
+    blocks = [{"type": "text", "text": content[:split], "cache_control": EPHEMERAL_CACHE}]
+    if content[split:].strip():
+        blocks.append({"type": "text", "text": content[split:]})
+    return {**message, "content": blocks}
+
+
+# =============================================================================
+# Response Caching
+# =============================================================================
+
+class ResponseCache:
+    """
+    SQLite-backed key/value store with TTL expiry.
+    
+    Entries are grouped by ``namespace`` so several caches with different TTLs
+    can share one database file. A connection is opened per operation, which
+    keeps the store safe to use from the crew's worker threads.
+    """
+    
+    def __init__(self, path: str, namespace: str, ttl_hours: float):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_hours * 3600
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+    
+    def _connect(self) -> closing:
+        return closing(sqlite3.connect(self.path, timeout=30))
+    
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a deterministic SHA256 key from the given parts."""
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return row[0]
+    
+    def set(self, key: str, value: str) -> None:
+        """Store ``value`` under ``key``, replacing any previous entry."""
+        with self._connect() as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (namespace, key, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self.namespace, key, value, time.time())
+            )
+    
+    def clear(self) -> None:
+        """Remove all entries in this namespace."""
+        with self._connect() as conn, conn:
+            conn.execute("DELETE FROM responses WHERE namespace = ?", (self.namespace,))
+
+
+class LLMResponseCache(BaseCache):
+    """LangChain cache adapter that stores chat generations in a ResponseCache."""
+    
+    def __init__(self, store: ResponseCache):
+        self.store = store
+    
+    def lookup(self, prompt: str, llm_string: str):
+        value = self.store.get(self.store.make_key(llm_string, prompt))
+        return loads(value) if value is not None else None
+    
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        self.store.set(self.store.make_key(llm_string, prompt), dumps(return_val))
+    
+    def clear(self, **kwargs) -> None:
+        self.store.clear()
+
+
+class BriefCache:
+    """
+    Cache of finished meeting briefs keyed by the meeting configuration.
+    
+    Configs are normalized (case and whitespace) and embedded with a local
+    sentence-transformers model. Only entries for the same company and
+    duration are candidates; among those a near-duplicate request reuses a
+    stored brief when cosine similarity reaches ``threshold``. Without
+    sentence-transformers only exact matches of the normalized config are
+    reused. Expired entries are pruned whenever a brief is stored.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        ttl_hours: float,
+        threshold: float = 0.95,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self._model_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meeting_briefs ("
+                "id INTEGER PRIMARY KEY, config_key TEXT NOT NULL, company TEXT NOT NULL, "
+                "duration_minutes INTEGER NOT NULL, embedding BLOB, config TEXT NOT NULL, "
+                "brief TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS meeting_briefs_lookup "
+                "ON meeting_briefs (company, duration_minutes, created_at)"
+            )
+    
+    def _connect(self) -> closing:
+        return closing(sqlite3.connect(self.path, timeout=30))
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(text.lower().split())
+    
+    @classmethod
+    def normalize(cls, config: MeetingConfig) -> str:
+        """Return the config's free-text fields, lowercased with collapsed whitespace."""
+        fields = (
+            config.company_name,
+            config.meeting_objective,
+            config.focus_areas,
+            config.attendees,
+        )
+        return "\n".join(cls._normalize_text(field) for field in fields)
+    
+    def _embed(self, text: str) -> Optional[array]:
+        if SentenceTransformer is None:
+            return None
+        with self._model_lock:
+            if self._model is None:
+                self._model = SentenceTransformer(self.model_name)
+        return array("f", self._model.encode(text, normalize_embeddings=True))
+    
+    def get(self, config: MeetingConfig) -> Optional[str]:
+        """Return the brief for the closest cached config, or None on a miss."""
+        text = self.normalize(config)
+        key = ResponseCache.make_key(text)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT config_key, embedding, brief FROM meeting_briefs "
+                "WHERE company = ? AND duration_minutes = ? AND created_at >= ? "
+                "ORDER BY created_at DESC",
+                (
+                    self._normalize_text(config.company_name),
+                    config.duration_minutes,
+                    time.time() - self.ttl_seconds,
+                )
+            ).fetchall()
+        
+        for config_key, _, brief in rows:
+            if config_key == key:
+                return brief
+        
+        embedding = self._embed(text) if rows else None
+        if embedding is None:
+            return None
+        best_score, best_brief = self.threshold, None
+        for _, blob, brief in rows:
+            if blob is None:
+                continue
+            # Embeddings are unit-normalized, so the dot product is the cosine
+            score = sum(a * b for a, b in zip(embedding, array("f", blob)))
+            if score >= best_score:
+                best_score, best_brief = score, brief
+        return best_brief
+    
+    def set(self, config: MeetingConfig, brief: str) -> None:
+        """Store the finished brief for ``config`` and prune expired entries."""
+        text = self.normalize(config)
+        embedding = self._embed(text)
+        now = time.time()
+        with self._connect() as conn, conn:
+            conn.execute(
+                "DELETE FROM meeting_briefs WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+            conn.execute(
+                "INSERT INTO meeting_briefs (config_key, company, duration_minutes, "
+                "embedding, config, brief, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    ResponseCache.make_key(text),
+                    self._normalize_text(config.company_name),
+                    config.duration_minutes,
+                    embedding.tobytes() if embedding is not None else None,
+                    json.dumps(asdict(config)),
+                    brief,
+                    now,
+                )
+            )
+
+
+# =============================================================================
+# Batched Search
+# =============================================================================
+
+class AsyncHTTPSession:
+    """
+    Long-lived ``httpx.AsyncClient`` driven by its own event-loop thread.
+    
+    Async clients are bound to the loop that created them, so instead of a new
+    client per ``asyncio.run`` call, callers on any thread submit coroutines
+    here and pooled connections survive across tool calls.
+    """
+    
+    def __init__(self, **client_kwargs: Any):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.client = self.run(self._create_client(client_kwargs))
+    
+    @staticmethod
+    async def _create_client(client_kwargs: dict) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**client_kwargs)
+    
+    def run(self, coro):
+        """Run ``coro`` on the session's loop and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def close(self) -> None:
+        """Close the client and stop the event-loop thread."""
+        self.run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def create_http_client() -> httpx.Client:
+    """Create the pooled HTTP/2 client used for Claude requests."""
+    return httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    )
+
+
+def create_search_session() -> AsyncHTTPSession:
+    """Create the pooled HTTP/2 session used for Serper searches."""
+    return AsyncHTTPSession(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=16)
+    )
+
+
+class BatchedSearchSchema(BaseModel):
+    """Input for BatchedSerperDevTool."""
+    queries: list[str] = Field(
+        ..., description="All search queries to run, passed together in a single call"
+    )
+
+
+class BatchedSerperDevTool(SerperDevTool):
+    """
+    Serper search tool that runs several queries concurrently in one tool call.
+    
+    Research tasks need several independent searches; issuing them together
+    replaces one agent step and HTTP round-trip per query with a single step
+    whose latency is that of the slowest query. Per-query results are memoized
+    in ``response_cache`` when one is given.
+    """
+    
+    name: str = "batched_search"
+    description: str = (
+        "Search the internet for several queries at once. Pass every query you "
+        "need as a list in one call; returns the top results for each query."
+    )
+    args_schema: Type[BaseModel] = BatchedSearchSchema
+    # Held per tool: the process environment is shared by every session
+    serper_api_key: str = Field(default="", exclude=True, repr=False)
+    response_cache: Optional[Any] = None
+    http_session: Optional[Any] = None
+    retry_counter: Optional[Any] = None
+    
+    def _run(self, queries: list[str], **kwargs: Any) -> str:
+        return self.batched_search(queries)
+    
+    def batched_search(self, queries: list[str]) -> str:
+        """Run all queries concurrently and return the results as one markdown block."""
+        if self.http_session is not None:
+            session = self.http_session
+            results = session.run(self._search_all(session.client, queries))
+        else:
+            results = asyncio.run(self._search_all_once(queries))
+        return "\n\n".join(
+            _format_search_results(query, result) for query, result in zip(queries, results)
+        )
+    
+    async def _search_all_once(self, queries: list[str]) -> list:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            return await self._search_all(client, queries)
+    
+    async def _search_all(self, client: httpx.AsyncClient, queries: list[str]) -> list:
+        return await asyncio.gather(
+            *(self._search(client, query) for query in queries),
+            return_exceptions=True
+        )
+    
+    def _payload(self, query: str) -> dict:
+        """Build the Serper request body, honoring the inherited locale settings."""
+        payload = {"q": query, "num": self.n_results}
+        if self.country:
+            payload["gl"] = self.country
+        if self.location:
+            payload["location"] = self.location
+        if self.locale:
+            payload["hl"] = self.locale
+        return payload
+    
+    async def _search(self, client: httpx.AsyncClient, query: str) -> dict:
+        payload = self._payload(query)
+        key = None
+        if self.response_cache is not None:
+            # SQLite calls block, and the HTTP session loop is shared by every session
+            key = self.response_cache.make_key(self.search_url, json.dumps(payload, sort_keys=True))
+            cached = await asyncio.to_thread(self.response_cache.get, key)
+            if cached is not None:
+                return json.loads(cached)
+        
+        async for attempt in AsyncRetrying(**transient_retry_policy(self.retry_counter)):
+            with attempt:
+                response = await client.post(
+                    self.search_url,
+                    json=payload,
+                    headers={"X-API-KEY": self.serper_api_key}
+                )
+                response.raise_for_status()
+        result = response.json()
+        
+        if key is not None:
+            await asyncio.to_thread(self.response_cache.set, key, json.dumps(result))
+        return result
+
+
+def _format_search_results(query: str, result) -> str:
+    """Render one Serper response (or the error it raised) as markdown."""
+    lines = [f"## Results for: {query}"]
+    if isinstance(result, Exception):
+        lines.append(f"Search failed: {result}")
+        return "\n".join(lines)
+    
+    for item in result.get("organic", []):
+        lines.append(f"- [{item.get('title', '')}]({item.get('link', '')})")
+        if item.get("snippet"):
+            lines.append(f"  {item['snippet']}")
+        if item.get("date"):
+            lines.append(f"  Date: {item['date']}")
+    if len(lines) == 1:
+        lines.append("No results found.")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Token Streaming
+# =============================================================================
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+# Sent to the sink when a new LLM call starts after part of an answer was
+# streamed; consumers discard the text received so far
+STREAM_RESET = object()
+
+
+@dataclass
+class _StreamState:
+    """Per-run state of a TokenStreamHandler."""
+    sink: queue.Queue
+    buffer: str = ""
+    answering: bool = False
+    at_start: bool = True
+
+
+class TokenStreamHandler(BaseCallbackHandler):
+    """
+    Forwards streamed LLM tokens to a queue registered by the calling context.
+    
+    Agents reason in a "Thought: ... Final Answer: ..." format, so tokens are
+    buffered until the final-answer marker appears and only the answer itself
+    is forwarded. Sinks are held in a context variable, which follows the run
+    into ``asyncio.to_thread`` workers, so one handler can be shared by
+    concurrent runs and LLM calls from unrelated threads are ignored.
+    
+    CrewAI calls the model again when an answer cannot be parsed or a final
+    answer is forced, so ``STREAM_RESET`` is put on the sink whenever a call
+    starts after answer text was already forwarded.
+    """
+    
+    def __init__(self):
+        self._state: contextvars.ContextVar[Optional[_StreamState]] = contextvars.ContextVar(
+            "token_stream_state", default=None
+        )
+    
+    def attach(self, sink: queue.Queue) -> None:
+        """Route tokens produced in the current context to ``sink``."""
+        self._state.set(_StreamState(sink))
+    
+    def detach(self) -> None:
+        """Stop routing tokens produced in the current context."""
+        self._state.set(None)
+    
+    def _reset(self) -> None:
+        state = self._state.get()
+        if state is None:
+            return
+        if not state.at_start:
+            state.sink.put(STREAM_RESET)
+        state.buffer = ""
+        state.answering = False
+        state.at_start = True
+    
+    def on_llm_start(self, serialized, prompts, **kwargs) -> None:
+        self._reset()
+    
+    def on_chat_model_start(self, serialized, messages, **kwargs) -> None:
+        self._reset()
+    
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        state = self._state.get()
+        if state is None:
+            return
+        
+        if not state.answering:
+            state.buffer += token
+            _, marker, token = state.buffer.partition(FINAL_ANSWER_MARKER)
+            if not marker:
+                return
+            state.answering = True
+        
+        if state.at_start:
+            token = token.lstrip()
+            state.at_start = not token
+        if token:
+            state.sink.put(token)
+
+
+class BriefStream:
+    """
+    Streams the executive brief of one meeting-preparation run.
+    
+    The crew runs on a worker thread while iteration yields tokens of the
+    brief. ``STREAM_RESET`` is yielded when the model restarted its answer,
+    after which text yielded so far should be discarded. If no tokens
+    were streamed (e.g. the response came from a cache), the complete brief is
+    yielded once at the end. The streamed text only
+    covers whatever happened to stream, so callers should persist ``brief``,
+    the value the crew returned, rather than the joined chunks.
+    """
+    
+    def __init__(self, crew_manager: "MeetingPrepCrew", config: MeetingConfig):
+        self.crew_manager = crew_manager
+        self.config = config
+        self.brief: Optional[str] = None
+    
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yields:
+            Chunks of the generated meeting brief markdown, or ``STREAM_RESET``
+            
+        Raises:
+            RuntimeError: If crew execution fails
+        """
+        token_stream = self.crew_manager.token_stream
+        sink: queue.Queue = queue.Queue()
+        done = object()
+        outcome = {}
+        
+        def run() -> None:
+            token_stream.attach(sink)
+            try:
+                outcome["result"] = self.crew_manager.prepare_meeting(self.config)
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                token_stream.detach()
+                sink.put(done)
+        
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        
+        streamed = False
+        while (chunk := sink.get()) is not done:
+            streamed = chunk is not STREAM_RESET
+            yield chunk
+        worker.join()
+        
+        if "error" in outcome:
+            raise outcome["error"]
+        self.brief = outcome["result"]
+        if not streamed:
+            yield self.brief
+
+
 # =============================================================================
 # Agent Factory
 # =============================================================================
 
 class AgentFactory:
-    """Factory for creating specialized meeting preparation agents."""
+    """
+    Factory for creating specialized meeting preparation agents.
     
-    def __init__(self, llm: ChatAnthropic, search_tool: Optional[SerperDevTool] = None):
-        self.llm = llm
+    ``llms`` maps a model tier ("fast" or "synth") to the LLM used by the
+    agents assigned to that tier.
+    """
+    
+    def __init__(
+        self,
+        llms: dict[str, ChatAnthropic],
+        search_tool: Optional[SerperDevTool] = None,
+        max_execution_time: Optional[int] = None
+    ):
+        self.llms = llms
         self.search_tool = search_tool
+        self.max_execution_time = max_execution_time
     
     def create_context_analyzer(self) -> Agent:
         return Agent(
             role="Meeting Context Specialist",
             goal="Analyze and summarize key background information for the meeting",
-            backstory=(
-                "You are an expert at quickly understanding complex business contexts "
-                "and identifying critical information. You excel at research and synthesis."
-            ),
-            verbose=True,
+            backstory="Research and synthesize company context succinctly.",
+            verbose=False,
             allow_delegation=False,
-            llm=self.llm,
+            max_execution_time=self.max_execution_time,
+            llm=self.llms["fast"],
             tools=[self.search_tool] if self.search_tool else []
         )
     
     def create_industry_expert(self) -> Agent:
         return Agent(
             role="Industry Expert",
-            goal="Provide in-depth industry analysis and identify key trends",
-            backstory=(
-                "You are a seasoned industry analyst with deep expertise in market dynamics. "
-                "You have a knack for spotting emerging trends and strategic opportunities."
-            ),
-            verbose=True,
+            goal="Provide in-depth industry analysis and identify key trends and opportunities",
+            backstory="Analyze market dynamics and surface trends with evidence.",
+            verbose=False,
             allow_delegation=False,
-            llm=self.llm,
+            max_execution_time=self.max_execution_time,
+            llm=self.llms["fast"],
             tools=[self.search_tool] if self.search_tool else []
         )
     
     def create_strategist(self) -> Agent:
         return Agent(
             role="Meeting Strategist",
-            goal="Develop a tailored meeting strategy and detailed agenda",
-            backstory=(
-                "You are a master meeting planner known for creating highly effective "
-                "strategies and agendas that drive productive outcomes."
-            ),
-            verbose=True,
+            goal="Develop a tailored meeting strategy and detailed agenda that drive productive outcomes",
+            backstory="Plan time-boxed agendas that drive decisions.",
+            verbose=False,
             allow_delegation=False,
-            llm=self.llm
+            max_execution_time=self.max_execution_time,
+            llm=self.llms["fast"]
         )
     
     def create_briefing_creator(self) -> Agent:
         return Agent(
             role="Communication Specialist",
-            goal="Synthesize information into concise and impactful briefings",
-            backstory=(
-                "You are an expert communicator skilled at distilling complex information "
-                "into clear, actionable insights that executives can quickly digest."
-            ),
-            verbose=True,
+            goal="Synthesize information into concise, actionable briefings executives can quickly digest",
+            backstory="Distill complex findings into clear, scannable insights.",
+            verbose=False,
             allow_delegation=False,
-            llm=self.llm
+            max_execution_time=self.max_execution_time,
+            llm=self.llms["synth"]
         )
 
 
 # =============================================================================
-# Task Factory
+# Context Compression
 # =============================================================================
 
-class TaskFactory:
-    """Factory for creating meeting preparation tasks with explicit chaining."""
-    
-    def __init__(self, config: MeetingConfig):
-        self.config = config
+_KEY_LINE = re.compile(r"^\s*(#{1,3}\s|[-*+]\s|\d+[.)]\s)")
+
+
+def compress_markdown(text: str, max_chars: int) -> str:
+    """
+    Reduce markdown to its headings and list items, capped at ``max_chars``.
     
-    def create_context_analysis_task(self, agent: Agent) -> Task:
-        return Task(
-            description=f"""
-Analyze the context for the meeting with {self.config.company_name}.
+    Text without any headings or list items is kept as-is (apart from the
+    length cap) so that unstructured output is never dropped entirely.
+    """
+    lines = [line.rstrip() for line in text.splitlines() if _KEY_LINE.match(line)]
+    compressed = "\n".join(lines) if lines else text.strip()
+    if len(compressed) > max_chars:
+        cut = compressed.rfind("\n", 0, max_chars)
+        compressed = compressed[:cut if cut > 0 else max_chars]
+    return compressed
+
+
+# =============================================================================
+# Prompt Templates
+# =============================================================================
 
-## Meeting Details
-- **Objective**: {self.config.meeting_objective}
-- **Attendees**: {self.config.attendees}
-- **Duration**: {self.config.duration_minutes} minutes
-- **Focus Areas**: {self.config.focus_areas}
+# Compiled once at import; placeholders are MeetingConfig field names.
+MEETING_HEADER_TPL = Template(
+    "## Meeting Details\n"
+    "- **Company**: $company_name\n"
+    "- **Objective**: $meeting_objective\n"
+    "- **Attendees**: $attendees\n"
+    "- **Duration**: $duration_minutes minutes\n"
+    "- **Focus Areas**: $focus_areas\n"
+)
+
+CONTEXT_ANALYSIS_TPL = Template("""
+## Task
+Analyze the context for the meeting with $company_name.
 
 ## Research Requirements
-Thoroughly research {self.config.company_name}:
+Thoroughly research $company_name with a single `batched_search` call
+that passes one query for each of these topics together:
 1. Recent news and press releases (last 6 months)
 2. Key products, services, and value proposition
 3. Major competitors and market position
 4. Leadership team and recent organizational changes
 5. Financial performance indicators (if publicly available)
 
+For example: `batched_search(queries=["$company_name news", "$company_name products and services", "$company_name competitors", "$company_name leadership team", "$company_name financial results"])`
+
 ## Deliverable
 Provide a comprehensive summary highlighting information most relevant to the meeting context.
 Use markdown formatting with clear headings and subheadings.
-            """,
-            agent=agent,
-            expected_output=(
-                "A detailed markdown analysis of meeting context and company background, "
-                "including recent developments, competitive position, and relevance to meeting objective."
-            )
-        )
-    
-    def create_industry_analysis_task(
-        self, 
-        agent: Agent, 
-        context_task: Task
-    ) -> Task:
-        return Task(
-            description=f"""
-Based on the context analysis, provide an in-depth industry analysis for {self.config.company_name}.
+            """)
+
+INDUSTRY_ANALYSIS_TPL = Template("""
+## Task
+Research the industry $company_name operates in and provide an in-depth industry analysis.
 
 ## Analysis Areas
 1. **Industry Trends**: Key developments shaping the industry
 2. **Competitive Landscape**: Major players and their positioning
 3. **Opportunities**: Growth areas and untapped potential
 4. **Threats**: Risks and challenges facing the industry
-5. **Market Positioning**: Where {self.config.company_name} fits in the ecosystem
+5. **Market Positioning**: Where $company_name fits in the ecosystem
+
+## Research Requirements
+Gather the data for all five analysis areas with a single `batched_search` call
+that passes one query per area together, rather than searching one area at a time.
 
 ## Requirements
-- Ensure analysis is directly relevant to: {self.config.meeting_objective}
-- Consider the perspectives of attendees: {self.config.attendees}
+- Ensure analysis is directly relevant to: $meeting_objective
+- Consider the perspectives of attendees: $attendees
 - Use markdown formatting with clear structure
-            """,
-            agent=agent,
-            context=[context_task],  # Explicit task chaining
-            expected_output=(
-                "A comprehensive markdown industry analysis including trends, competitive landscape, "
-                "opportunities, threats, and strategic insights relevant to the meeting."
-            )
-        )
-    
-    def create_strategy_task(
-        self, 
-        agent: Agent, 
-        context_task: Task,
-        industry_task: Task
-    ) -> Task:
-        return Task(
-            description=f"""
-Develop a tailored meeting strategy and detailed agenda for the {self.config.duration_minutes}-minute meeting.
+            """)
+
+STRATEGY_TPL = Template("""
+## Task
+Develop a tailored meeting strategy and detailed agenda for the $duration_minutes-minute meeting.
 
 ## Agenda Requirements
 Create a time-boxed agenda including:
@@ -194,37 +906,23 @@ Create a time-boxed agenda including:
 - Potential objections and how to address them
 
 ## Strategic Considerations
-- Address focus areas: {self.config.focus_areas}
-- Align with objective: {self.config.meeting_objective}
-- Optimize for attendee roles: {self.config.attendees}
+- Address focus areas: $focus_areas
+- Align with objective: $meeting_objective
+- Optimize for attendee roles: $attendees
 
 Use markdown formatting with clear structure.
-            """,
-            agent=agent,
-            context=[context_task, industry_task],  # Explicit task chaining
-            expected_output=(
-                "A detailed markdown meeting strategy with time-boxed agenda, talking points, "
-                "discussion questions, and strategies for specific focus areas."
-            )
-        )
-    
-    def create_executive_brief_task(
-        self, 
-        agent: Agent,
-        context_task: Task,
-        industry_task: Task,
-        strategy_task: Task
-    ) -> Task:
-        return Task(
-            description=f"""
-Synthesize all gathered information into a comprehensive executive brief for the meeting with {self.config.company_name}.
+            """)
+
+EXECUTIVE_BRIEF_TPL = Template("""
+## Task
+Synthesize all gathered information into a comprehensive executive brief for the meeting with $company_name.
 
 ## Brief Components
 
 ### 1. Executive Summary (One Page)
 - Meeting objective statement
 - Key attendees and their roles
-- Critical background points about {self.config.company_name}
+- Critical background points about $company_name
 - Top 3-5 strategic goals for the meeting
 - Meeting structure overview
 
@@ -251,8 +949,96 @@ For each point include:
 - Bold key information for quick scanning
 - Structure for easy navigation during the meeting
 
-Ensure alignment with objective: {self.config.meeting_objective}
-            """,
+Ensure alignment with objective: $meeting_objective
+            """)
+
+
+# =============================================================================
+# Task Factory
+# =============================================================================
+
+class TaskFactory:
+    """
+    Factory for creating meeting preparation tasks with explicit chaining.
+    
+    The context and industry research tasks are independent peers; when
+    ``parallel_research`` is set they run concurrently and the strategy task
+    waits for both before starting. Outputs of upstream tasks are compressed
+    to at most ``context_max_chars`` before downstream tasks receive them.
+    """
+    
+    def __init__(
+        self,
+        config: MeetingConfig,
+        parallel_research: bool = True,
+        context_max_chars: int = 6000
+    ):
+        self.config = config
+        self.parallel_research = parallel_research
+        self.context_max_chars = context_max_chars
+        # Placed first in every task description so repeated runs for the same
+        # meeting render byte-identical prompts (required for cache hits).
+        self._fields = asdict(config)
+        self._header = MEETING_HEADER_TPL.substitute(self._fields)
+    
+    def _compress_output(self, output) -> None:
+        """Task callback that compresses an output in place before it is used as context."""
+        # Handle different CrewAI versions
+        attr = "raw" if hasattr(output, "raw") else "raw_output"
+        text = getattr(output, attr, None)
+        if isinstance(text, str):
+            setattr(output, attr, compress_markdown(text, self.context_max_chars))
+    
+    def create_context_analysis_task(self, agent: Agent) -> Task:
+        return Task(
+            description=self._header + CONTEXT_ANALYSIS_TPL.substitute(self._fields),
+            agent=agent,
+            async_execution=self.parallel_research,
+            callback=self._compress_output,
+            expected_output=(
+                "A detailed markdown analysis of meeting context and company background, "
+                "including recent developments, competitive position, and relevance to meeting objective."
+            )
+        )
+    
+    def create_industry_analysis_task(self, agent: Agent) -> Task:
+        return Task(
+            description=self._header + INDUSTRY_ANALYSIS_TPL.substitute(self._fields),
+            agent=agent,
+            async_execution=self.parallel_research,  # Independent of the context task
+            callback=self._compress_output,
+            expected_output=(
+                "A comprehensive markdown industry analysis including trends, competitive landscape, "
+                "opportunities, threats, and strategic insights relevant to the meeting."
+            )
+        )
+    
+    def create_strategy_task(
+        self, 
+        agent: Agent, 
+        context_task: Task,
+        industry_task: Task
+    ) -> Task:
+        return Task(
+            description=self._header + STRATEGY_TPL.substitute(self._fields),
+            agent=agent,
+            context=[context_task, industry_task],  # Explicit task chaining
+            callback=self._compress_output,
+            expected_output=(
+                "A detailed markdown meeting strategy with time-boxed agenda, talking points, "
+                "discussion questions, and strategies for specific focus areas."
+            )
+        )
+    
+    def create_executive_brief_task(
+        self, 
+        agent: Agent,
+        context_task: Task,
+        industry_task: Task,
+        strategy_task: Task
+    ) -> Task:
+        return Task(
+            description=self._header + EXECUTIVE_BRIEF_TPL.substitute(self._fields),
             agent=agent,
             context=[context_task, industry_task, strategy_task],  # Full context chain
             expected_output=(
@@ -267,34 +1053,184 @@ Ensure alignment with objective: {self.config.meeting_objective}
 # =============================================================================
 
 class MeetingPrepCrew:
-    """Manages the meeting preparation crew and execution."""
+    """
+    Manages the meeting preparation crew and execution.
+    
+    Agents do not depend on the meeting details, so they are built once here
+    and reused across runs; only tasks and the crew are built per request.
+    Agents, ``trace`` and ``retries`` belong to one run at a time, so a run
+    started while another is still in progress is refused.
     
-    def __init__(self, anthropic_api_key: str, serper_api_key: str, llm_config: LLMConfig = None):
+    Verbose CrewAI logging is disabled; instead the most recent agent steps of
+    the current run are kept in a bounded in-memory ``trace`` that the UI shows
+    when a run fails.
+    
+    HTTP connection pools may be passed in to share them between managers;
+    otherwise the manager creates its own and releases them in ``close``.
+    """
+    
+    def __init__(
+        self,
+        anthropic_api_key: str,
+        serper_api_key: str,
+        llm_config: LLMConfig = None,
+        crew_config: CrewConfig = None,
+        cache_config: CacheConfig = None,
+        http_client: Optional[httpx.Client] = None,
+        search_http: Optional[AsyncHTTPSession] = None
+    ):
         self.llm_config = llm_config or LLMConfig()
-        self._setup_environment(anthropic_api_key, serper_api_key)
-        self._initialize_components(anthropic_api_key)
-    
-    def _setup_environment(self, anthropic_key: str, serper_key: str) -> None:
-        """Set up environment variables for API access."""
-        os.environ["ANTHROPIC_API_KEY"] = anthropic_key
-        os.environ["SERPER_API_KEY"] = serper_key
-    
-    def _initialize_components(self, api_key: str) -> None:
-        """Initialize LLM and tools."""
-        self.llm = ChatAnthropic(
-            model="claude-3-haiku-20240307",
+        self.crew_config = crew_config or CrewConfig()
+        self.cache_config = cache_config or CacheConfig()
+        self.trace: deque = deque(maxlen=self.crew_config.trace_size)
+        self.retries = RetryCounter()
+        self._run_lock = threading.Lock()
+        self._initialize_components(anthropic_api_key, serper_api_key, http_client, search_http)
+    
+    def _initialize_components(
+        self,
+        api_key: str,
+        serper_key: str,
+        http_client: Optional[httpx.Client],
+        search_http: Optional[AsyncHTTPSession]
+    ) -> None:
+        """Initialize LLMs, tools and the HTTP connection pools."""
+        self._owns_http = http_client is None
+        self._owns_search_http = search_http is None
+        self._http = http_client or create_http_client()
+        self._search_http = search_http or create_search_session()
+        
+        self.llm_cache = None
+        self.brief_cache = None
+        search_cache = None
+        if self.cache_config.enabled:
+            self.brief_cache = BriefCache(
+                self.cache_config.path,
+                self.cache_config.brief_ttl_hours,
+                threshold=self.cache_config.brief_similarity_threshold
+            )
+            self.llm_cache = LLMResponseCache(ResponseCache(
+                self.cache_config.path, "llm", self.cache_config.llm_ttl_hours
+            ))
+            search_cache = ResponseCache(
+                self.cache_config.path, "serper", self.cache_config.search_ttl_hours
+            )
+        
+        # Only the synthesis model produces the brief, so only it is streamed
+        self.token_stream = TokenStreamHandler()
+        self.llms = {
+            "fast": self._create_llm(self.llm_config.model_fast, api_key),
+            "synth": self._create_llm(
+                self.llm_config.model_synth, api_key, callbacks=[self.token_stream]
+            ),
+        }
+        self.search_tool = BatchedSerperDevTool(
+            serper_api_key=serper_key,
+            response_cache=search_cache,
+            http_session=self._search_http,
+            retry_counter=self.retries
+        )
+        self.agent_factory = AgentFactory(
+            self.llms,
+            self.search_tool,
+            max_execution_time=self.crew_config.timeout_seconds
+        )
+        
+        self.agents = self._create_agents()
+    
+    def _create_agents(self) -> list[Agent]:
+        """Create the context analyzer, industry expert, strategist and briefing creator."""
+        return [
+            self.agent_factory.create_context_analyzer(),
+            self.agent_factory.create_industry_expert(),
+            self.agent_factory.create_strategist(),
+            self.agent_factory.create_briefing_creator(),
+        ]
+    
+    def _create_llm(
+        self,
+        model: str,
+        api_key: str,
+        callbacks: Optional[list[BaseCallbackHandler]] = None
+    ) -> ChatAnthropic:
+        """Create a prompt-caching, streaming Claude client for the given model."""
+        return CachedChatAnthropic(
+            model=model,
             temperature=self.llm_config.temperature,
             anthropic_api_key=api_key,
+            streaming=True,
+            callbacks=callbacks,
+            cache=self.llm_cache,
+            http_client=self._http,
+            # Transient errors are retried with backoff by CachedChatAnthropic
+            max_retries=0,
+            retry_counter=self.retries,
         )
-        self.search_tool = SerperDevTool()
-        self.agent_factory = AgentFactory(self.llm, self.search_tool)
     
-    def prepare_meeting(self, config: MeetingConfig) -> str:
+    @contextmanager
+    def _exclusive_run(self):
+        """Hold the manager for one run and reset its per-run diagnostics."""
+        # A Streamlit rerun abandons the page loop but not the worker thread,
+        # so the previous run may still be using the agents
+        if not self._run_lock.acquire(blocking=False):
+            raise RuntimeError(
+                "A meeting preparation is already running; wait for it to finish "
+                "before starting another."
+            )
+        try:
+            self.trace.clear()
+            self.retries.reset()
+            yield
+        finally:
+            self._run_lock.release()
+    
+    def close(self) -> None:
+        """Close the HTTP connection pools this manager created itself."""
+        if self._owns_http:
+            self._http.close()
+        if self._owns_search_http:
+            self._search_http.close()
+    
+    def _build_crew(self, config: MeetingConfig, agents: list[Agent]) -> Crew:
+        """Create the tasks for ``config`` and assemble them into a crew."""
+        context_analyzer, industry_expert, strategist, briefing_creator = agents
+        
+        # Create tasks with explicit chaining
+        task_factory = TaskFactory(
+            config,
+            parallel_research=self.crew_config.parallel_research,
+            context_max_chars=self.crew_config.context_max_chars
+        )
+        
+        # Context and industry research run concurrently when enabled
+        context_task = task_factory.create_context_analysis_task(context_analyzer)
+        industry_task = task_factory.create_industry_analysis_task(industry_expert)
+        strategy_task = task_factory.create_strategy_task(
+            strategist, context_task, industry_task
+        )
+        brief_task = task_factory.create_executive_brief_task(
+            briefing_creator, context_task, industry_task, strategy_task
+        )
+        
+        return Crew(
+            agents=agents,
+            tasks=[context_task, industry_task, strategy_task, brief_task],
+            verbose=False,
+            process=Process.sequential,
+            step_callback=self.trace.append
+        )
+    
+    async def prepare_meeting_async(
+        self,
+        config: MeetingConfig,
+        agents: Optional[list[Agent]] = None
+    ) -> str:
         """
-        Execute the meeting preparation workflow.
+        Execute the meeting preparation workflow without blocking the event loop.
         
         Args:
             config: Meeting configuration details
+            agents: Agents to run the crew with; defaults to the shared agents
             
         Returns:
             Generated meeting preparation brief as markdown string
@@ -302,36 +1238,83 @@ class MeetingPrepCrew:
         Raises:
             RuntimeError: If crew execution fails
         """
-        # Create agents
-        context_analyzer = self.agent_factory.create_context_analyzer()
-        industry_expert = self.agent_factory.create_industry_expert()
-        strategist = self.agent_factory.create_strategist()
-        briefing_creator = self.agent_factory.create_briefing_creator()
-        
-        # Create tasks with explicit chaining
-        task_factory = TaskFactory(config)
-        
-        context_task = task_factory.create_context_analysis_task(context_analyzer)
-        industry_task = task_factory.create_industry_analysis_task(industry_expert, context_task)
-        strategy_task = task_factory.create_strategy_task(strategist, context_task, industry_task)
-        brief_task = task_factory.create_executive_brief_task(
-            briefing_creator, context_task, industry_task, strategy_task
-        )
+        # Near-duplicate requests reuse a previously generated brief; SQLite and
+        # embedding calls block, so they run off the event loop
+        if self.brief_cache is not None:
+            cached = await asyncio.to_thread(self.brief_cache.get, config)
+            if cached is not None:
+                return cached
         
-        # Assemble and run crew
-        crew = Crew(
-            agents=[context_analyzer, industry_expert, strategist, briefing_creator],
-            tasks=[context_task, industry_task, strategy_task, brief_task],
-            verbose=True,
-            process=Process.sequential
-        )
+        crew = self._build_crew(config, agents or self.agents)
         
         try:
-            result = crew.kickoff()
+            result = await crew.kickoff_async()
             # Handle different CrewAI versions
-            return result.raw if hasattr(result, 'raw') else str(result)
+            brief = result.raw if hasattr(result, 'raw') else str(result)
         except Exception as e:
             raise RuntimeError(f"Meeting preparation failed: {str(e)}") from e
+        
+        if self.brief_cache is not None:
+            await asyncio.to_thread(self.brief_cache.set, config, brief)
+        return brief
+    
+    def prepare_meeting(self, config: MeetingConfig) -> str:
+        """
+        Execute the meeting preparation workflow.
+        
+        Args:
+            config: Meeting configuration details
+            
+        Returns:
+            Generated meeting preparation brief as markdown string
+            
+        Raises:
+            RuntimeError: If crew execution fails or another run is in progress
+        """
+        with self._exclusive_run():
+            return asyncio.run(self.prepare_meeting_async(config))
+    
+    def prepare_meetings(self, configs: list[MeetingConfig]) -> list[str]:
+        """
+        Prepare several meetings concurrently.
+        
+        At most ``max_parallel_agents`` crews run at once to stay clear of API
+        rate limits. Each crew gets its own agents, since agents hold per-run
+        state and cannot be shared between concurrently running crews.
+        
+        Args:
+            configs: Meeting configuration details, one per meeting
+            
+        Returns:
+            Generated briefs in the same order as ``configs``
+            
+        Raises:
+            RuntimeError: If any crew execution fails or another run is in progress
+        """
+        with self._exclusive_run():
+            return asyncio.run(self._prepare_meetings(configs))
+    
+    async def _prepare_meetings(self, configs: list[MeetingConfig]) -> list[str]:
+        semaphore = asyncio.Semaphore(self.crew_config.max_parallel_agents)
+        
+        async def prepare(config: MeetingConfig) -> str:
+            async with semaphore:
+                return await self.prepare_meeting_async(config, self._create_agents())
+        
+        return await asyncio.gather(*(prepare(config) for config in configs))
+    
+    def prepare_meeting_stream(self, config: MeetingConfig) -> "BriefStream":
+        """
+        Execute the meeting preparation workflow, streaming the brief as it is written.
+        
+        Args:
+            config: Meeting configuration details
+            
+        Returns:
+            A BriefStream yielding chunks of the brief; its ``brief`` attribute
+            holds the brief the crew returned once iteration finishes
+        """
+        return BriefStream(self, config)
 
 
 # =============================================================================
@@ -420,6 +1403,38 @@ def render_meeting_form() -> Optional[MeetingConfig]:
     )
 
 
+def render_debug_trace(crew_manager: MeetingPrepCrew) -> None:
+    """Show the agent steps recorded during the last run."""
+    if not crew_manager.trace:
+        return
+    with st.expander("Debug trace"):
+        st.code("\n\n".join(str(step) for step in crew_manager.trace), language=None)
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_pools() -> tuple[httpx.Client, AsyncHTTPSession]:
+    """Return the Claude and Serper connection pools shared by all sessions."""
+    return create_http_client(), create_search_session()
+
+
+def get_crew_manager(anthropic_key: str, serper_key: str) -> MeetingPrepCrew:
+    """Return the session's crew manager, rebuilding it only when the API keys change."""
+    keys = (anthropic_key, serper_key)
+    if st.session_state.get("crew_manager_keys") != keys:
+        previous = st.session_state.get("crew_manager")
+        if previous is not None:
+            previous.close()
+        http_client, search_http = get_http_pools()
+        st.session_state["crew_manager"] = MeetingPrepCrew(
+            anthropic_key,
+            serper_key,
+            http_client=http_client,
+            search_http=search_http
+        )
+        st.session_state["crew_manager_keys"] = keys
+    return st.session_state["crew_manager"]
+
+
 def main():
     """Main application entry point."""
     st.set_page_config(
@@ -451,14 +1466,22 @@ def main():
     
     if st.button("🚀 Prepare Meeting", type="primary", use_container_width=True):
         try:
-            crew_manager = MeetingPrepCrew(anthropic_key, serper_key)
-            
+            crew_manager = get_crew_manager(anthropic_key, serper_key)
+            stream = crew_manager.prepare_meeting_stream(meeting_config)
             with st.spinner("🤖 AI agents are preparing your meeting... This may take a few minutes."):
-                result = crew_manager.prepare_meeting(meeting_config)
+                output = st.empty()
+                streamed = ""
+                for chunk in stream:
+                    # A restarted answer replaces the text streamed so far
+                    streamed = "" if chunk is STREAM_RESET else streamed + chunk
+                    output.markdown(streamed)
+            # Show and offer the brief the crew returned, not the streamed text
+            result = stream.brief
+            output.markdown(result)
+            if crew_manager.retries.count:
+                st.toast(f"🔁 Recovered from {crew_manager.retries.count} transient API error(s)")
             
             st.success("✅ Meeting preparation complete!")
-            st.divider()
-            st.markdown(result)
             
             # Download option
             st.download_button(
@@ -470,6 +1493,7 @@ def main():
             
         except RuntimeError as e:
             st.error(f"❌ {str(e)}")
+            render_debug_trace(crew_manager)
         except Exception as e:
             st.error(f"❌ An unexpected error occurred: {str(e)}")
             st.info("Please check your API keys and try again.")
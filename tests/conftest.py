@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# app.py lives at the repository root rather than in an installed package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,96 @@
+"""Tests for the finished-brief cache."""
+
+import math
+import sqlite3
+
+import pytest
+
+import app
+
+
+class FakeSentenceTransformer:
+    """Embeds text as its normalized letter counts."""
+    
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+    
+    def encode(self, text: str, normalize_embeddings: bool = True) -> list[float]:
+        counts = [float(text.count(letter)) for letter in "abcdefghijklmnopqrstuvwxyz"]
+        norm = math.sqrt(sum(count * count for count in counts)) or 1.0
+        return [count / norm for count in counts]
+
+
+def _config(company: str = "Acme Corp", objective: str = "Discuss the renewal", duration: int = 60):
+    return app.MeetingConfig(
+        company_name=company,
+        meeting_objective=objective,
+        attendees="CFO",
+        duration_minutes=duration,
+        focus_areas="Pricing",
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(app.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def exact_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "SentenceTransformer", None)
+    return app.BriefCache(str(tmp_path / "cache.sqlite"), ttl_hours=1)
+
+
+@pytest.fixture
+def semantic_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "SentenceTransformer", FakeSentenceTransformer)
+    return app.BriefCache(str(tmp_path / "cache.sqlite"), ttl_hours=1, threshold=0.95)
+
+
+def test_exact_match_ignores_case_and_whitespace(exact_cache):
+    exact_cache.set(_config(), "brief")
+    
+    assert exact_cache.get(_config(company="  acme   CORP ", objective="discuss the RENEWAL")) == "brief"
+
+
+def test_exact_only_cache_misses_on_different_wording(exact_cache):
+    exact_cache.set(_config(), "brief")
+    
+    assert exact_cache.get(_config(objective="Discuss renewal")) is None
+
+
+def test_similar_request_reuses_brief(semantic_cache):
+    semantic_cache.set(_config(), "brief")
+    
+    assert semantic_cache.get(_config(objective="Discuss the renewals")) == "brief"
+
+
+def test_similar_request_for_another_company_misses(semantic_cache):
+    semantic_cache.set(_config(), "brief")
+    
+    assert semantic_cache.get(_config(company="Acme Corps")) is None
+
+
+def test_different_duration_misses(semantic_cache):
+    semantic_cache.set(_config(), "brief")
+    
+    assert semantic_cache.get(_config(duration=30)) is None
+
+
+def test_expired_brief_misses(exact_cache, clock):
+    exact_cache.set(_config(), "brief")
+    clock[0] += 3601
+    
+    assert exact_cache.get(_config()) is None
+
+
+def test_set_prunes_expired_rows(exact_cache, clock):
+    exact_cache.set(_config(), "old")
+    clock[0] += 3601
+    exact_cache.set(_config(company="Globex"), "new")
+    
+    with sqlite3.connect(exact_cache.path) as conn:
+        briefs = [row[0] for row in conn.execute("SELECT brief FROM meeting_briefs")]
+    assert briefs == ["new"]
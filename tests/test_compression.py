@@ -0,0 +1,27 @@
+"""Tests for compressing upstream task outputs."""
+
+import app
+
+
+def test_keeps_only_headings_and_list_items():
+    text = "# Title\nIntro paragraph.\n## Section\n- point one\nfiller\n1. step\n* other"
+    
+    assert app.compress_markdown(text, 1000) == "# Title\n## Section\n- point one\n1. step\n* other"
+
+
+def test_unstructured_text_is_kept():
+    assert app.compress_markdown("  Just a paragraph.\n", 1000) == "Just a paragraph."
+
+
+def test_cap_cuts_at_a_line_boundary():
+    text = "- first item\n- second item\n- third item"
+    
+    assert app.compress_markdown(text, 30) == "- first item\n- second item"
+
+
+def test_cap_without_line_break_truncates():
+    assert app.compress_markdown("x" * 50, 10) == "x" * 10
+
+
+def test_deep_headings_are_dropped():
+    assert app.compress_markdown("#### Detail\n### Kept", 100) == "### Kept"
@@ -0,0 +1,56 @@
+"""Tests for the prompt-cache breakpoint on CrewAI's ReAct prompt."""
+
+import app
+
+
+REACT_PROMPT = (
+    "You are Strategist. Plan meetings.\nYour personal goal is: Win\n"
+    "\nCurrent Task: ## Meeting Details\n- **Company**: Acme\n"
+    "\n\nBegin! This is VERY important to you, use the tools available and give "
+    "your best Final Answer, your job depends on it!\n\nThought:"
+)
+SCRATCHPAD = "\nI should search first.\nAction: batched_search\nObservation: results\nThought:"
+
+
+def _message(text: str) -> dict:
+    return {"role": "user", "content": text}
+
+
+def test_fixed_prompt_gets_its_own_cached_block():
+    message = app._with_stable_prefix_breakpoint(_message(REACT_PROMPT + SCRATCHPAD))
+    
+    fixed, scratchpad = message["content"]
+    assert fixed == {"type": "text", "text": REACT_PROMPT, "cache_control": app.EPHEMERAL_CACHE}
+    assert scratchpad == {"type": "text", "text": SCRATCHPAD}
+
+
+def test_cached_block_is_identical_across_turns():
+    first = app._with_stable_prefix_breakpoint(_message(REACT_PROMPT + "\n"))
+    later = app._with_stable_prefix_breakpoint(_message(REACT_PROMPT + SCRATCHPAD + SCRATCHPAD))
+    
+    assert first["content"] == [later["content"][0]]
+
+
+def test_single_text_block_content_is_split():
+    message = {"role": "user", "content": [{"type": "text", "text": REACT_PROMPT + SCRATCHPAD}]}
+    
+    assert len(app._with_stable_prefix_breakpoint(message)["content"]) == 2
+
+
+def test_messages_without_react_prompt_are_unchanged():
+    plain = _message("Summarize this.\n\nThought: maybe")
+    blocks = {"role": "user", "content": [{"type": "text", "text": REACT_PROMPT}, {"type": "text", "text": "x"}]}
+    
+    assert app._with_stable_prefix_breakpoint(plain) is plain
+    assert app._with_stable_prefix_breakpoint(blocks) is blocks
+
+
+def test_request_payload_marks_only_the_fixed_prompt():
+    llm = app.CachedChatAnthropic(model="claude-3-haiku-20240307", anthropic_api_key="test-key")
+    
+    payload = llm._get_request_payload(REACT_PROMPT + SCRATCHPAD)
+    
+    assert not payload.get("system")
+    assert [block.get("cache_control") for block in payload["messages"][0]["content"]] == [
+        app.EPHEMERAL_CACHE, None
+    ]
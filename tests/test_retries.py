@@ -0,0 +1,95 @@
+"""Tests for transient-error retries around Claude calls."""
+
+import json
+
+import anthropic
+import httpx
+import pytest
+from tenacity import wait_none
+
+import app
+
+
+def _sse(events: list[dict]) -> bytes:
+    """Encode Anthropic streaming events as a server-sent events body."""
+    return "".join(
+        f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events
+    ).encode()
+
+
+STREAMED_REPLY = _sse([
+    {
+        "type": "message_start",
+        "message": {
+            "id": "msg_test",
+            "type": "message",
+            "role": "assistant",
+            "model": "claude-3-haiku-20240307",
+            "content": [],
+            "stop_reason": None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": 10, "output_tokens": 1},
+        },
+    },
+    {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+    {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hi there"}},
+    {"type": "content_block_stop", "index": 0},
+    {
+        "type": "message_delta",
+        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+        "usage": {"output_tokens": 3},
+    },
+    {"type": "message_stop"},
+])
+
+
+def _error(status_code: int, error_type: str) -> httpx.Response:
+    return httpx.Response(
+        status_code, json={"type": "error", "error": {"type": error_type, "message": error_type}}
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    policy = app.transient_retry_policy
+    monkeypatch.setattr(
+        app, "transient_retry_policy", lambda counter=None: {**policy(counter), "wait": wait_none()}
+    )
+
+
+def _llm(responses: list[httpx.Response], requests: list, counter: app.RetryCounter):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+    
+    return app.CachedChatAnthropic(
+        model="claude-3-haiku-20240307",
+        anthropic_api_key="test-key",
+        streaming=True,
+        max_retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_counter=counter,
+    )
+
+
+def test_overloaded_response_is_retried_through_invoke():
+    requests, counter = [], app.RetryCounter()
+    ok = httpx.Response(200, headers={"content-type": "text/event-stream"}, content=STREAMED_REPLY)
+    llm = _llm([_error(529, "overloaded_error"), ok], requests, counter)
+    
+    result = llm.invoke("Hello")
+    
+    assert result.content == "Hi there"
+    assert len(requests) == 2
+    assert counter.count == 1
+
+
+def test_client_errors_are_not_retried():
+    requests, counter = [], app.RetryCounter()
+    llm = _llm([_error(400, "invalid_request_error")], requests, counter)
+    
+    with pytest.raises(anthropic.BadRequestError):
+        llm.invoke("Hello")
+    
+    assert len(requests) == 1
+    assert counter.count == 0
@@ -0,0 +1,57 @@
+"""Tests for forwarding final-answer tokens to the brief stream."""
+
+import queue
+
+import app
+
+
+def _drain(sink: queue.Queue) -> list:
+    items = []
+    while not sink.empty():
+        items.append(sink.get())
+    return items
+
+
+def _call(handler: app.TokenStreamHandler, tokens: list[str]) -> None:
+    handler.on_chat_model_start({}, [])
+    for token in tokens:
+        handler.on_llm_new_token(token)
+
+
+def test_only_the_final_answer_is_forwarded():
+    handler, sink = app.TokenStreamHandler(), queue.Queue()
+    handler.attach(sink)
+    
+    _call(handler, ["Thought: I know it\nFinal", " Answer:  # Brief", "\nDone"])
+    
+    assert _drain(sink) == ["# Brief", "\nDone"]
+
+
+def test_reasoning_calls_forward_nothing():
+    handler, sink = app.TokenStreamHandler(), queue.Queue()
+    handler.attach(sink)
+    
+    _call(handler, ["Thought: search first\n", "Action: batched_search"])
+    _call(handler, ["Thought: I know it\nFinal Answer: Brief"])
+    
+    assert _drain(sink) == ["Brief"]
+
+
+def test_new_call_after_streamed_answer_sends_reset():
+    handler, sink = app.TokenStreamHandler(), queue.Queue()
+    handler.attach(sink)
+    
+    _call(handler, ["Final Answer: First", " draft\nAction: oops"])
+    _call(handler, ["Final Answer: Second"])
+    
+    assert _drain(sink) == ["First", " draft\nAction: oops", app.STREAM_RESET, "Second"]
+
+
+def test_detached_context_is_ignored():
+    handler, sink = app.TokenStreamHandler(), queue.Queue()
+    handler.attach(sink)
+    handler.detach()
+    
+    _call(handler, ["Final Answer: Brief"])
+    
+    assert _drain(sink) == []